@@ -1,7 +1,9 @@
 """Petivity integration for Home Assistant."""
 import asyncio
 import logging
+from collections import OrderedDict
 from datetime import timedelta
+from typing import Any, Dict, List, Tuple
 
 import voluptuous as vol
 import homeassistant.helpers.config_validation as cv
@@ -10,7 +12,14 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryNotReady
 
-from .const import DOMAIN, PLATFORMS
+from .const import (
+    DOMAIN,
+    PLATFORMS,
+    HISTORY_MAX_CONCURRENT,
+    HISTORY_MAX_PENDING,
+    HISTORY_CACHE_SIZE,
+    HISTORY_CACHE_TTL,
+)
 from .coordinator import PetivityStatusCoordinator, PetivityWeightCoordinator
 
 _LOGGER = logging.getLogger(__name__)
@@ -22,24 +31,89 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     status_coordinator = PetivityStatusCoordinator(hass, entry)
     weight_coordinator = PetivityWeightCoordinator(hass, entry)
     
-    # Fetch initial data
-    await status_coordinator.async_config_entry_first_refresh()
+    async def async_shutdown_coordinators() -> None:
+        """Stop both coordinators and their catalysis worker processes."""
+        # Each waits on its own worker process exiting, so stop them together
+        await asyncio.gather(
+            status_coordinator.async_shutdown(),
+            weight_coordinator.async_shutdown(),
+        )
     
-    # Store coordinators
+    # Store coordinators; the weight refresh finds the status coordinator here
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][entry.entry_id] = {
         "status_coordinator": status_coordinator,
         "weight_coordinator": weight_coordinator,
     }
     
+    # Fetch initial status and weights together, falling back to each refresh alone
+    try:
+        if not await weight_coordinator.async_prime(status_coordinator):
+            await status_coordinator.async_config_entry_first_refresh()
+            # Load weights before the platforms so a failure surfaces before any entity exists
+            await weight_coordinator.async_config_entry_first_refresh()
+    except Exception as err:
+        hass.data[DOMAIN].pop(entry.entry_id)
+        await async_shutdown_coordinators()
+        if isinstance(err, ConfigEntryNotReady):
+            raise
+        raise ConfigEntryNotReady(f"Failed to set up Petivity: {err}") from err
+    
+    # Bound concurrent history lookups and shed load once too many are queued
+    history_semaphore = asyncio.Semaphore(HISTORY_MAX_CONCURRENT)
+    pending_history = 0
+    
+    # Recent history results keyed on (cat_id, days) -> (expiry, data), oldest first
+    history_cache: OrderedDict[Tuple[str, int], Tuple[float, List[Dict[str, Any]]]] = OrderedDict()
+    
     # Register services
     async def get_weight_history(call):
         """Service to get historical weight data for a cat."""
+        nonlocal pending_history
         cat_id = call.data.get("cat_id")
         days = call.data.get("days", 30)
+        key = (cat_id, days)
+        
+        cached = history_cache.get(key)
+        if cached is not None and cached[0] > hass.loop.time():
+            _LOGGER.debug("Weight history cache hit for cat %s over %d days", cat_id, days)
+            history_cache.move_to_end(key)
+            hass.bus.async_fire(
+                f"{DOMAIN}_weight_history_response",
+                {
+                    "cat_id": cat_id,
+                    "days": days,
+                    "data": cached[1],
+                    "request_id": call.data.get("request_id", ""),
+                }
+            )
+            return
+        
+        _LOGGER.debug("Weight history cache miss for cat %s over %d days", cat_id, days)
         
+        if pending_history >= HISTORY_MAX_PENDING:
+            _LOGGER.warning("Too many pending weight history requests, dropping request for cat %s", cat_id)
+            hass.bus.async_fire(
+                f"{DOMAIN}_weight_history_error",
+                {
+                    "cat_id": cat_id,
+                    "error": "Too many pending weight history requests",
+                    "request_id": call.data.get("request_id", ""),
+                }
+            )
+            return
+        
+        pending_history += 1
         try:
-            historical_data = await weight_coordinator.async_get_historical_weight(cat_id, days)
+            async with history_semaphore:
+                historical_data = await weight_coordinator.async_get_historical_weight(cat_id, days)
+            
+            # Empty results usually mean the fetch failed, so don't hold on to them
+            if historical_data:
+                history_cache[key] = (hass.loop.time() + HISTORY_CACHE_TTL, historical_data)
+                history_cache.move_to_end(key)
+                while len(history_cache) > HISTORY_CACHE_SIZE:
+                    history_cache.popitem(last=False)
             
             # Return data via event for the frontend to consume
             hass.bus.async_fire(
@@ -62,6 +136,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
                     "request_id": call.data.get("request_id", ""),
                 }
             )
+        finally:
+            pending_history -= 1
     
     # Register the service
     hass.services.async_register(
@@ -75,8 +151,14 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         })
     )
     
-    # Set up platforms
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    # Data is loaded, so nothing below raises ConfigEntryNotReady once platforms start
+    try:
+        await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    except Exception:
+        hass.services.async_remove(DOMAIN, "get_weight_history")
+        hass.data[DOMAIN].pop(entry.entry_id)
+        await async_shutdown_coordinators()
+        raise
     
     return True
 
@@ -86,5 +168,11 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     if unload_ok:
         # Remove services
         hass.services.async_remove(DOMAIN, "get_weight_history")
-        hass.data[DOMAIN].pop(entry.entry_id)
+        coordinators = hass.data[DOMAIN].pop(entry.entry_id)
+        
+        # Stop the catalysis worker processes together
+        await asyncio.gather(
+            coordinators["status_coordinator"].async_shutdown(),
+            coordinators["weight_coordinator"].async_shutdown(),
+        )
     return unload_ok
@@ -247,6 +247,39 @@ catalysis_status() {
     catalysis_api "$json_query" "$current_jwt"
 }
 
+# Status plus per-cat weight aggregation in a single query
+catalysis_status_with_weight() {
+    local from_date="$1"
+    local to_date="$2"
+    local resolution="${3:-DAY}"
+    
+    if [[ -z "$from_date" || -z "$to_date" ]]; then
+        echo "Usage: catalysis status-with-weight <from_date> <to_date> [resolution]"
+        echo "Example: catalysis status-with-weight 2025-07-07 2025-07-14 DAY"
+        return 1
+    fi
+    
+    local current_jwt=$(get_petivity_jwt) || return 1
+    
+    local escaped_jwt=$(printf '%s' "$current_jwt" | jq -Rs '.')
+    local variables=$(jq -n \
+        --argjson jwt "$escaped_jwt" \
+        --arg fromDate "$from_date" \
+        --arg toDate "$to_date" \
+        --arg resolution "$resolution" \
+        '{jwt: $jwt, fromDate: $fromDate, toDate: $toDate, resolution: $resolution}')
+    
+    local query=$(load_query "./queries/status-with-weight.graphql") || return 1
+    
+    local json_query=$(jq -n \
+        --arg operationName "RetrievePetsMachineWithWeight" \
+        --argjson variables "$variables" \
+        --arg query "$query" \
+        '{operationName: $operationName, variables: $variables, query: $query}')
+    
+    catalysis_api "$json_query" "$current_jwt"
+}
+
 # Cat weight aggregation command
 catalysis_weight() {
     local cat_id="$1"
@@ -282,6 +315,69 @@ catalysis_weight() {
     catalysis_api "$json_query" "$current_jwt"
 }
 
+# Batched cat weight command - one aliased GraphQL query for several cats
+# Prints an object keyed on cat ID, each value shaped like a `weight` response
+catalysis_weight_batch() {
+    local cat_ids="$1"
+    local from_date="$2"
+    local to_date="$3"
+    local resolution="${4:-DAY}"
+    
+    if [[ -z "$cat_ids" || -z "$from_date" || -z "$to_date" ]]; then
+        echo "Usage: catalysis weight-batch <cat_id,cat_id,...> <from_date> <to_date> [resolution]"
+        echo "Example: catalysis weight-batch Q2F0OmU1...,Q2F0OmE3... 2025-06-14 2025-07-14 DAY"
+        return 1
+    fi
+    
+    local current_jwt=$(get_petivity_jwt) || return 1
+    
+    local escaped_jwt=$(printf '%s' "$current_jwt" | jq -Rs '.')
+    local ids_json=$(jq -Rc 'split(",")' <<< "$cat_ids")
+    local variables=$(jq -n \
+        --argjson jwt "$escaped_jwt" \
+        --argjson ids "$ids_json" \
+        --arg fromDate "$from_date" \
+        --arg toDate "$to_date" \
+        --arg resolution "$resolution" \
+        '{jwt: $jwt, fromDate: $fromDate, toDate: $toDate, resolution: $resolution}
+         + (reduce range(0; $ids | length) as $i ({}; . + {"cat\($i)": $ids[$i]}))')
+    
+    # One aliased node per cat: c0: node(id: $cat0) { ...CatWeightFragment }
+    local count=$(jq 'length' <<< "$ids_json")
+    local var_defs=""
+    local selections=""
+    local i
+    for (( i = 0; i < count; i++ )); do
+        var_defs+=", \$cat$i: ID!"
+        selections+="    c$i: node(id: \$cat$i) { ...CatWeightFragment }"$'\n'
+    done
+    
+    local fragment=$(load_query "./queries/cat-weight-batch.graphql") || return 1
+    local query="$fragment"$'\n\n'"query RetrieveCatsUnfilteredAggWeight(\$jwt: String, \$fromDate: Date, \$toDate: Date, \$resolution: AggregateResolutionEnum$var_defs) {"$'\n'"  authenticate(jwt: \$jwt) {"$'\n'"$selections  }"$'\n'"}"
+    
+    local json_query=$(jq -n \
+        --arg operationName "RetrieveCatsUnfilteredAggWeight" \
+        --argjson variables "$variables" \
+        --arg query "$query" \
+        '{operationName: $operationName, variables: $variables, query: $query}')
+    
+    if [[ "$DRY_RUN" == "true" ]]; then
+        catalysis_api "$json_query" "$current_jwt"
+        return $?
+    fi
+    
+    # Split the aliased response back into one weight response per cat,
+    # keeping only each cat's latest weight aggregate
+    catalysis_api "$json_query" "$current_jwt" | jq --argjson ids "$ids_json" '
+        def latest: if (.aggregatedEvents.weight? | type) == "array"
+            then .aggregatedEvents.weight |= .[-1:] else . end;
+        if .data.authenticate == null then .
+        else . as $r
+            | reduce range(0; $ids | length) as $i ({};
+                . + {($ids[$i]): {data: {authenticate: {node: ($r.data.authenticate["c\($i)"] | latest)}}}})
+        end'
+}
+
 # Cat PEDT results command
 catalysis_alerts() {
     local cat_id="$1"
@@ -416,6 +512,72 @@ catalysis_token_info() {
     is_token_valid "$PETIVITY_JWT"
 }
 
+# Emit a single-line JSON error response for serve mode
+serve_error() {
+    jq -cn --arg error "$1" '{error: $error}'
+}
+
+# Serve command - long-lived worker for the Home Assistant integration
+# Reads one JSON request per line on stdin: {"cmd": "<command>", "args": [...]}
+# Writes exactly one line of compact JSON per request on stdout: the API
+# response, or {"error": "<message>"} if the command failed
+catalysis_serve() {
+    local request cmd output response token exit_code
+    local -a args
+
+    while IFS= read -r request; do
+        [[ -z "$request" ]] && continue
+
+        cmd=$(jq -r '.cmd // empty' <<< "$request" 2>/dev/null)
+        mapfile -t args < <(jq -r '.args[]? | tostring' <<< "$request" 2>/dev/null)
+
+        # Refresh once here so the token is reused across requests
+        if token=$(get_valid_token "$PETIVITY_JWT"); then
+            PETIVITY_JWT="$token"
+        else
+            serve_error "No valid token available"
+            continue
+        fi
+
+        case "$cmd" in
+            "status")
+                output=$(catalysis_status)
+                ;;
+            "status-with-weight")
+                output=$(catalysis_status_with_weight "${args[@]}")
+                ;;
+            "weight")
+                output=$(catalysis_weight "${args[@]}")
+                ;;
+            "weight-batch")
+                output=$(catalysis_weight_batch "${args[@]}")
+                ;;
+            "alerts")
+                output=$(catalysis_alerts "${args[@]}")
+                ;;
+            "insights")
+                output=$(catalysis_insights "${args[@]}")
+                ;;
+            "events")
+                output=$(catalysis_events "${args[@]}")
+                ;;
+            *)
+                serve_error "Unknown command: $cmd"
+                continue
+                ;;
+        esac
+        exit_code=$?
+
+        if [[ $exit_code -ne 0 ]]; then
+            serve_error "Command $cmd failed with exit code $exit_code: $output"
+        elif response=$(jq -cs 'if length == 1 then .[0] else error("expected a single JSON document") end' <<< "$output" 2>/dev/null); then
+            printf '%s\n' "$response"
+        else
+            serve_error "Invalid JSON response: ${output:0:200}"
+        fi
+    done
+}
+
 # Usage and help
 case "${1:-help}" in
     "status")
@@ -424,12 +586,24 @@ case "${1:-help}" in
         fi
         catalysis_status
         ;;
+    "status-with-weight")
+        if [[ "$5" == "--dry-run" ]]; then
+            DRY_RUN=true
+        fi
+        catalysis_status_with_weight "$2" "$3" "$4"
+        ;;
     "weight")
         if [[ "$6" == "--dry-run" ]]; then
             DRY_RUN=true
         fi
         catalysis_weight "$2" "$3" "$4" "$5"
         ;;
+    "weight-batch")
+        if [[ "$6" == "--dry-run" ]]; then
+            DRY_RUN=true
+        fi
+        catalysis_weight_batch "$2" "$3" "$4" "$5"
+        ;;
     "alerts")
         if [[ "$7" == "--dry-run" ]]; then
             DRY_RUN=true
@@ -454,6 +628,9 @@ case "${1:-help}" in
     "token-info")
         catalysis_token_info
         ;;
+    "serve")
+        catalysis_serve
+        ;;
     "help"|*)
         echo "Petivity API Helper - Usage:"
         echo ""
@@ -461,7 +638,11 @@ case "${1:-help}" in
         echo ""
         echo "Commands:"
         echo "  status                              Get overview of cats and machines"
+        echo "  status-with-weight <from> <to> [res]"
+        echo "                                      Get overview plus each cat's weight data"
         echo "  weight <cat_id> <from> <to> [res]   Get cat weight data over time"
+        echo "  weight-batch <cat_id,...> <from> <to> [res]"
+        echo "                                      Get latest weight for several cats at once"
         echo "  alerts <cat_id> <after> <before>    Get PEDT health alerts for cat"
         echo "  insights <cat_id> <from> <to> <prev_from> <prev_to> [res]"
         echo "                                      Get detailed analytics with comparisons"
@@ -469,6 +650,7 @@ case "${1:-help}" in
         echo "                                      Get household events"
         echo "  refresh                             Manually refresh access token"
         echo "  token-info                          Show current token information"
+        echo "  serve                               Answer JSON requests read line by line from stdin"
         echo ""
         echo "Options:"
         echo "  --dry-run     Print the curl command that would be executed"
@@ -487,7 +669,9 @@ case "${1:-help}" in
         echo ""
         echo "Query files needed in ./queries/:"
         echo "  status.graphql"
+        echo "  status-with-weight.graphql"
         echo "  cat-weight.graphql"
+        echo "  cat-weight-batch.graphql"
         echo "  cat-alerts.graphql"
         echo "  cat-insights.graphql"
         echo "  household-events.graphql"
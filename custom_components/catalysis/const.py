@@ -12,9 +12,28 @@ CONF_REFRESH_TOKEN = "petivity_refresh_token"
 STATUS_UPDATE_INTERVAL = 30  # minutes
 WEIGHT_UPDATE_INTERVAL = 24 * 60  # minutes (24 hours)
 
+# Unit conversion
+GRAMS_TO_POUNDS = 0.00220462
+
 # Default time windows for weight data
 WEIGHT_TIME_WINDOW = 7  # days
 
+# get_weight_history service limits
+HISTORY_MAX_CONCURRENT = 2  # requests running at once
+HISTORY_MAX_PENDING = 8  # requests running or queued before new ones are dropped
+HISTORY_CACHE_SIZE = 32  # distinct (cat_id, days) results kept
+HISTORY_CACHE_TTL = 300  # seconds
+
+# Catalysis worker settings
+COMMAND_TIMEOUT = 120  # seconds
+WORKER_STREAM_LIMIT = 16 * 1024 * 1024  # bytes, largest single JSON response
+
+# How long a command response may be reused before rerunning it
+COMMAND_CACHE_TTL = {
+    "weight": 12 * 60 * 60,  # seconds
+    "weight-batch": 12 * 60 * 60,  # seconds
+}
+
 # Bundled paths (relative to integration directory)
 SCRIPT_RELATIVE_PATH = "bin/catalysis.sh"
 QUERIES_RELATIVE_PATH = "queries"
\ No newline at end of file
@@ -4,9 +4,14 @@ import json
 import logging
 import os
 import stat
-import subprocess
-from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    # orjson parses bytes directly and much faster; it ships with Home Assistant
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
@@ -17,15 +22,63 @@ from .const import (
     STATUS_UPDATE_INTERVAL,
     WEIGHT_UPDATE_INTERVAL,
     WEIGHT_TIME_WINDOW,
+    GRAMS_TO_POUNDS,
     CONF_JWT,
     CONF_CLIENT_ID,
     CONF_REFRESH_TOKEN,
     SCRIPT_RELATIVE_PATH,
     QUERIES_RELATIVE_PATH,
+    COMMAND_TIMEOUT,
+    COMMAND_CACHE_TTL,
+    WORKER_STREAM_LIMIT,
 )
+from .models import Cat, CatWeight, Machine
 
 _LOGGER = logging.getLogger(__name__)
 
+# Pounds in hundredths per gram, for rounding with integer arithmetic
+_CENTIPOUNDS_PER_GRAM = GRAMS_TO_POUNDS * 100
+
+def _grams_to_pounds(weight_grams: float) -> float:
+    """Convert grams to pounds, rounded half up to 2 decimals."""
+    return int(weight_grams * _CENTIPOUNDS_PER_GRAM + 0.5) / 100
+
+def _activity_date(last_activated: Optional[str]) -> Optional[date]:
+    """Return the calendar date of a cat's lastActivated timestamp, if it parses."""
+    try:
+        return datetime.fromisoformat(last_activated).date()
+    except (TypeError, ValueError):
+        return None
+
+# Key paths into GraphQL responses
+_CATS_PATH = ("data", "authenticate", "myHousehold", "cats")
+_MACHINES_PATH = ("data", "authenticate", "myHousehold", "machines")
+_WEIGHT_PATH = ("data", "authenticate", "node", "aggregatedEvents", "weight")
+
+def _dig(data: Any, path: Tuple[str, ...]) -> Any:
+    """Follow a key path through nested dicts, returning None if any step is missing."""
+    try:
+        for key in path:
+            data = data[key]
+    except (KeyError, TypeError):
+        return None
+    return data
+
+def _is_cacheable(response: Any) -> bool:
+    """Return whether a worker reply is a successful GraphQL result."""
+    if not isinstance(response, dict) or not response or response.get("errors"):
+        return False
+    if "data" in response:
+        return response["data"] is not None
+    # weight-batch replies map each cat ID to its own GraphQL result
+    return all(
+        isinstance(result, dict) and not result.get("errors") and result.get("data") is not None
+        for result in response.values()
+    )
+
+# Process environment for the worker, snapshotted once; only credentials vary per entry
+_BASE_ENV: Dict[str, str] = dict(os.environ)
+
 class PetivityCoordinatorBase(DataUpdateCoordinator):
     """Base coordinator for Petivity data."""
     
@@ -39,8 +92,19 @@ class PetivityCoordinatorBase(DataUpdateCoordinator):
         self._script_path = os.path.join(integration_dir, SCRIPT_RELATIVE_PATH)
         self._working_dir = integration_dir
         
-        # Ensure script is executable on initialization
-        self._ensure_script_executable()
+        # Script permissions are checked off the event loop before the first launch
+        self._executable_checked = False
+        
+        # Worker environment, built once from the entry's credentials
+        self._env: Optional[Dict[str, str]] = None
+        entry.async_on_unload(entry.add_update_listener(self._async_entry_updated))
+        
+        # Long-lived worker process, launched on the first command
+        self._proc: Optional[asyncio.subprocess.Process] = None
+        self._lock = asyncio.Lock()
+        
+        # Command responses keyed on (command, args) -> (expiry, response)
+        self._cache: Dict[Tuple[str, Tuple[str, ...]], Tuple[float, Any]] = {}
         
         super().__init__(
             hass,
@@ -74,75 +138,158 @@ class PetivityCoordinatorBase(DataUpdateCoordinator):
     
     def _get_environment(self) -> Dict[str, str]:
         """Get environment variables for the script."""
-        env = os.environ.copy()
-        env.update({
-            "PETIVITY_JWT": self.entry.data[CONF_JWT],
-            "PETIVITY_CLIENT_ID": self.entry.data[CONF_CLIENT_ID], 
-            "PETIVITY_REFRESH_TOKEN": self.entry.data[CONF_REFRESH_TOKEN],
-        })
-        return env
+        if self._env is None:
+            self._env = {
+                **_BASE_ENV,
+                "PETIVITY_JWT": self.entry.data[CONF_JWT],
+                "PETIVITY_CLIENT_ID": self.entry.data[CONF_CLIENT_ID],
+                "PETIVITY_REFRESH_TOKEN": self.entry.data[CONF_REFRESH_TOKEN],
+            }
+        return self._env
+    
+    async def _async_entry_updated(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
+        """Rebuild the environment and restart the worker when credentials change."""
+        self._env = None
+        async with self._lock:
+            await self._stop_worker()
     
-    async def _run_catalysis_command(self, command: str, *args) -> Dict[str, Any]:
-        """Execute a catalysis command and return parsed JSON."""
-        cmd = [self._script_path, command] + list(args)
-        env = self._get_environment()
+    async def _run_catalysis_command(self, command: str, *args, cache: bool = True) -> Dict[str, Any]:
+        """Send a command to the catalysis worker and return parsed JSON.
         
-        _LOGGER.debug("Executing: %s", " ".join(cmd))
+        Pass cache=False for lookups that must not share the command cache.
+        """
+        # Serve from cache while the previous response is still fresh
+        key = (command, args)
+        cached = self._cache.get(key) if cache else None
+        if cached is not None and cached[0] > self.hass.loop.time():
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("Cache hit for %s %s", command, " ".join(args))
+            return cached[1]
         
-        try:
-            result = await self.hass.async_add_executor_job(
-                self._execute_command, cmd, env
-            )
-            
-            if result.returncode != 0:
-                _LOGGER.error(
-                    "Command failed with exit code %d: %s", 
-                    result.returncode, 
-                    result.stderr
-                )
-                raise UpdateFailed(f"Command failed: {result.stderr}")
-            
-            # Parse JSON output
+        request = json.dumps({"cmd": command, "args": list(args)}) + "\n"
+        
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Executing: %s %s", command, " ".join(args))
+        
+        # The worker answers one request at a time, in order
+        async with self._lock:
             try:
-                return json.loads(result.stdout)
-            except json.JSONDecodeError as err:
-                _LOGGER.error("Failed to parse JSON response: %s", result.stdout)
-                raise UpdateFailed(f"Invalid JSON response: {err}")
+                # The deadline covers the write as well, in case the worker stops reading
+                line = await asyncio.wait_for(self._exchange(request), timeout=COMMAND_TIMEOUT)
                 
-        except subprocess.TimeoutExpired:
-            _LOGGER.error("Command timed out")
-            raise UpdateFailed("Command timed out")
-        except Exception as err:
-            _LOGGER.error("Command execution failed: %s", err)
-            raise UpdateFailed(f"Command execution failed: {err}")
+                # Parse JSON output (orjson.JSONDecodeError subclasses json's)
+                try:
+                    response = json_loads(line)
+                except json.JSONDecodeError as err:
+                    # Responses can span megabytes; only log the head
+                    _LOGGER.error("Failed to parse JSON response: %r", line[:200])
+                    raise UpdateFailed(f"Invalid JSON response: {err}")
+                    
+            except asyncio.TimeoutError:
+                _LOGGER.error("Command timed out")
+                await self._stop_worker()
+                raise UpdateFailed("Command timed out")
+            except UpdateFailed:
+                # The worker is out of sync or gone; relaunch it on the next command
+                await self._stop_worker()
+                raise
+            except Exception as err:
+                _LOGGER.error("Command execution failed: %s", err)
+                await self._stop_worker()
+                raise UpdateFailed(f"Command execution failed: {err}")
+            except BaseException:
+                # Cancelled mid-exchange; the unread reply would answer the next request
+                await self._stop_worker()
+                raise
+        
+        if isinstance(response, dict) and "error" in response:
+            _LOGGER.error("Command failed: %s", response["error"])
+            raise UpdateFailed(f"Command failed: {response['error']}")
+        
+        # GraphQL failures arrive as ordinary replies; never keep those around
+        ttl = COMMAND_CACHE_TTL.get(command) if cache else None
+        if ttl and _is_cacheable(response):
+            now = self.hass.loop.time()
+            # Drop expired entries so one-off requests don't accumulate
+            self._cache = {k: v for k, v in self._cache.items() if v[0] > now}
+            self._cache[key] = (now + ttl, response)
+        
+        return response
     
-    def _execute_command(self, cmd: List[str], env: Dict[str, str]) -> subprocess.CompletedProcess:
-        """Execute command synchronously with permission retry."""
-        try:
-            return subprocess.run(
-                cmd,
-                cwd=self._working_dir,
-                env=env,
-                capture_output=True,
-                text=True,
-                timeout=120,
-                check=False,
-            )
-        except PermissionError:
-            # Try to fix permissions and retry once
-            _LOGGER.warning("Permission denied, attempting to fix script permissions and retry")
-            self._ensure_script_executable()
-            
-            # Retry the command
-            return subprocess.run(
-                cmd,
-                cwd=self._working_dir,
-                env=env,
-                capture_output=True,
-                text=True,
-                timeout=120,
-                check=False,
+    async def _exchange(self, request: str) -> bytes:
+        """Write one request to the worker and read its response line."""
+        proc = await self._ensure_worker()
+        proc.stdin.write(request.encode())
+        await proc.stdin.drain()
+        line = await proc.stdout.readline()
+        
+        if not line:
+            raise UpdateFailed("Catalysis worker exited unexpectedly")
+        return line
+    
+    async def _ensure_worker(self) -> asyncio.subprocess.Process:
+        """Return the running catalysis worker, launching it if needed."""
+        if self._proc is not None and self._proc.returncode is None:
+            return self._proc
+        
+        if not self._executable_checked:
+            await self.hass.async_add_executor_job(self._ensure_script_executable)
+            self._executable_checked = True
+        
+        self._proc = await self._start_worker()
+        
+        self.entry.async_create_background_task(
+            self.hass,
+            self._watch_worker(self._proc),
+            f"{DOMAIN} catalysis worker watchdog",
+        )
+        return self._proc
+    
+    async def _start_worker(self) -> asyncio.subprocess.Process:
+        """Launch a long-lived catalysis worker process."""
+        _LOGGER.debug("Starting catalysis worker: %s serve", self._script_path)
+        return await asyncio.create_subprocess_exec(
+            self._script_path,
+            "serve",
+            cwd=self._working_dir,
+            env=self._get_environment(),
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            limit=WORKER_STREAM_LIMIT,
+        )
+    
+    async def _watch_worker(self, proc: asyncio.subprocess.Process) -> None:
+        """Drain worker diagnostics and notice when the worker dies on its own."""
+        # Forward stderr to the debug log so the pipe never fills
+        while line := await proc.stderr.readline():
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("catalysis: %s", line.decode(errors="replace").rstrip())
+        
+        returncode = await proc.wait()
+        
+        # Workers we stopped ourselves are no longer current
+        if self._proc is proc:
+            _LOGGER.warning(
+                "Catalysis worker exited with code %s, restarting it on the next command",
+                returncode,
             )
+            self._proc = None
+    
+    async def _stop_worker(self) -> None:
+        """Terminate the catalysis worker if it is running."""
+        proc, self._proc = self._proc, None
+        if proc is None:
+            return
+        
+        if proc.returncode is None:
+            proc.kill()
+        await proc.wait()
+    
+    async def async_shutdown(self) -> None:
+        """Shut down the coordinator and its catalysis worker."""
+        await super().async_shutdown()
+        await self._stop_worker()
 
 class PetivityStatusCoordinator(PetivityCoordinatorBase):
     """Coordinator for status data (cats and machines)."""
@@ -150,98 +297,173 @@ class PetivityStatusCoordinator(PetivityCoordinatorBase):
     def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
         """Initialize status coordinator."""
         super().__init__(hass, entry, STATUS_UPDATE_INTERVAL)
+        
+        # Parsed results, valid for as long as self.data is the same object
+        self._cats_source: Optional[Dict[str, Any]] = None
+        self._cats: List[Cat] = []
+        self._cats_by_id: Dict[str, Cat] = {}
+        self._machines_source: Optional[Dict[str, Any]] = None
+        self._machines: List[Machine] = []
+        self._machines_by_id: Dict[str, Machine] = {}
     
     async def _async_update_data(self) -> Dict[str, Any]:
         """Fetch status data."""
         return await self._run_catalysis_command("status")
     
-    def get_cats(self) -> List[Dict[str, Any]]:
+    def get_cats(self) -> List[Cat]:
         """Extract cat information from status data."""
         # Add null check to prevent AttributeError
         if not self.data:
             _LOGGER.debug("No status data available for cats")
             return []
         
+        if self._cats_source is not self.data:
+            self._cats = self._parse_cats()
+            self._cats_by_id = {cat.id: cat for cat in self._cats}
+            self._cats_source = self.data
+        return self._cats
+    
+    def get_cat_count(self) -> int:
+        """Return the number of cats."""
+        return len(self.get_cats())
+    
+    def get_cat_by_id(self, cat_id: str) -> Optional[Cat]:
+        """Return a single cat by ID."""
+        self.get_cats()
+        return self._cats_by_id.get(cat_id)
+    
+    def _parse_cats(self) -> List[Cat]:
+        """Parse cats out of the current status data."""
+        # Parse actual GraphQL response structure
+        cats_data = _dig(self.data, _CATS_PATH) or []
+        
         cats = []
         try:
-            # Parse actual GraphQL response structure
-            cats_data = self.data.get("data", {}).get("authenticate", {}).get("myHousehold", {}).get("cats", [])
-            
             for cat in cats_data:
                 activity_state = cat.get("activityState", {})
-                cats.append({
-                    "id": cat.get("id"),
-                    "name": cat.get("name"),
-                    "most_recent_event": activity_state.get("mostRecentEvent"),
-                    "last_activated": activity_state.get("lastActivated"),
-                    "cat_not_seen_warning": activity_state.get("catNotSeenWarning", False),
-                })
+                cats.append(Cat(
+                    id=cat.get("id"),
+                    name=cat.get("name"),
+                    most_recent_event=activity_state.get("mostRecentEvent"),
+                    last_activated=activity_state.get("lastActivated"),
+                    cat_not_seen_warning=activity_state.get("catNotSeenWarning", False),
+                ))
         except (KeyError, TypeError) as err:
             _LOGGER.warning("Failed to extract cat data: %s", err)
         
         return cats
     
-    def get_machines(self) -> List[Dict[str, Any]]:
+    def get_machines(self) -> List[Machine]:
         """Extract machine information from status data."""
         # Add null check to prevent AttributeError
         if not self.data:
             _LOGGER.debug("No status data available for machines")
             return []
         
+        if self._machines_source is not self.data:
+            self._machines = self._parse_machines()
+            self._machines_by_id = {machine.id: machine for machine in self._machines}
+            self._machines_source = self.data
+        return self._machines
+    
+    def get_machine_count(self) -> int:
+        """Return the number of machines."""
+        return len(self.get_machines())
+    
+    def get_machine_by_id(self, machine_id: str) -> Optional[Machine]:
+        """Return a single machine by ID."""
+        self.get_machines()
+        return self._machines_by_id.get(machine_id)
+    
+    def _parse_machines(self) -> List[Machine]:
+        """Parse machines out of the current status data."""
+        # Parse actual GraphQL response structure
+        machines_data = _dig(self.data, _MACHINES_PATH) or []
+        
         machines = []
         try:
-            # Parse actual GraphQL response structure  
-            machines_data = self.data.get("data", {}).get("authenticate", {}).get("myHousehold", {}).get("machines", [])
-            
             for machine in machines_data:
-                # Parse elimination events for detailed tracking
-                elimination_events = machine.get("eliminationEvents", [])
-                
                 # Process events for easier access
                 processed_events = []
+                append_event = processed_events.append
                 event_counts = {"urination": 0, "defecation": 0, "combo": 0, "unknown": 0}
                 
-                for event in elimination_events:
+                # Parse elimination events for detailed tracking
+                for event in machine.get("eliminationEvents", []):
                     classification = event.get("normalisedClassification", {})
-                    if classification.get("isCat") and classification.get("isElimination"):
-                        elim_type = classification.get("elimType", "unknown")
-                        cat_info = classification.get("cat", {})
-                        
-                        processed_event = {
-                            "start_time": event.get("startTime"),
-                            "elimination_type": elim_type,
-                            "cat_id": cat_info.get("id"),
-                        }
-                        processed_events.append(processed_event)
-                        
-                        # Count by type
-                        event_counts[elim_type] = event_counts.get(elim_type, 0) + 1
+                    get = classification.get
+                    if not (get("isCat") and get("isElimination")):
+                        continue
+                    
+                    elim_type = get("elimType", "unknown")
+                    append_event({
+                        "start_time": event.get("startTime"),
+                        "elimination_type": elim_type,
+                        "cat_id": get("cat", {}).get("id"),
+                    })
+                    
+                    # Count by type
+                    event_counts[elim_type] = event_counts.get(elim_type, 0) + 1
                 
                 # Get most recent event details
                 most_recent_event = processed_events[0] if processed_events else None
+                last_event_type = most_recent_event.get("elimination_type") if most_recent_event else None
+                last_event_cat_id = most_recent_event.get("cat_id") if most_recent_event else None
+                
+                # Resolve the cat name for the last event
+                last_event_cat_name = "Unknown"
+                if last_event_cat_id:
+                    cat = self.get_cat_by_id(last_event_cat_id)
+                    if cat is not None:
+                        last_event_cat_name = cat.name
                 
-                machines.append({
-                    "id": machine.get("name", "unknown"),  # Using name as ID since no explicit ID field
-                    "name": machine.get("name"),
-                    "battery_percentage": machine.get("batteryPercentage"),
-                    "show_battery_warning": machine.get("showBatteryWarning", False),
-                    "wifi_rssi": machine.get("wifiRssi"),
-                    "power_mode": machine.get("powerMode"),
-                    "is_frozen": machine.get("isFrozen", False),
-                    "most_recent_upload": machine.get("mostRecentUploadAt"),
-                    "upload_warning": machine.get("mostRecentUploadWarning", False),
-                    "is_dirty": machine.get("isDirty", False),
-                    "balanced_status": machine.get("balancedStatus"),
+                # Overall state, most severe condition first
+                is_frozen = machine.get("isFrozen", False)
+                upload_warning = machine.get("mostRecentUploadWarning", False)
+                show_battery_warning = machine.get("showBatteryWarning", False)
+                is_dirty = machine.get("isDirty", False)
+                if is_frozen:
+                    primary_state = "FROZEN"
+                elif upload_warning:
+                    primary_state = "UPLOAD_WARNING"
+                elif show_battery_warning:
+                    primary_state = "LOW_BATTERY"
+                elif is_dirty:
+                    primary_state = "NEEDS_CLEANING"
+                else:
+                    primary_state = "NORMAL"
+                power_mode = machine.get("powerMode")
+                
+                # Using name as ID since no explicit ID field; the API can send a null name
+                machine_id = machine.get("name") or "unknown"
+                
+                machines.append(Machine(
+                    id=machine_id,
+                    slug=machine_id.lower().replace(" ", "_"),
+                    name=machine.get("name"),
+                    battery_percentage=machine.get("batteryPercentage"),
+                    show_battery_warning=show_battery_warning,
+                    wifi_rssi=machine.get("wifiRssi"),
+                    power_mode=power_mode,
+                    is_frozen=is_frozen,
+                    most_recent_upload=machine.get("mostRecentUploadAt"),
+                    upload_warning=upload_warning,
+                    is_dirty=is_dirty,
+                    balanced_status=machine.get("balancedStatus"),
+                    primary_state=primary_state,
+                    status_string=f"{primary_state} | {power_mode or 'UNKNOWN'}",
                     
                     # Enhanced event tracking
-                    "recent_events": processed_events,
-                    "recent_event_count": len(processed_events),
-                    "event_counts": event_counts,
-                    "most_recent_event": most_recent_event,
-                    "last_event_time": most_recent_event.get("start_time") if most_recent_event else None,
-                    "last_event_type": most_recent_event.get("elimination_type") if most_recent_event else None,
-                    "last_event_cat_id": most_recent_event.get("cat_id") if most_recent_event else None,
-                })
+                    recent_events=processed_events,
+                    recent_event_count=len(processed_events),
+                    event_counts=event_counts,
+                    most_recent_event=most_recent_event,
+                    last_event_time=most_recent_event.get("start_time") if most_recent_event else None,
+                    last_event_type=last_event_type,
+                    last_event_title=last_event_type.title() if last_event_type else "None",
+                    last_event_cat_id=last_event_cat_id,
+                    last_event_cat_name=last_event_cat_name,
+                ))
         except (KeyError, TypeError) as err:
             _LOGGER.warning("Failed to extract machine data: %s", err)
         
@@ -253,7 +475,14 @@ class PetivityWeightCoordinator(PetivityCoordinatorBase):
     def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
         """Initialize weight coordinator."""
         super().__init__(hass, entry, WEIGHT_UPDATE_INTERVAL)
-        self._cat_weights = {}
+        self._cat_weights: Dict[str, CatWeight] = {}
+        
+        # (start_date, end_date, cat_ids) of the last complete refresh, and when it ran
+        self._last_sig: Optional[Tuple[Any, ...]] = None
+        self._last_refresh_ts = 0.0
+        
+        # cat_id -> last_activated the stored weight was fetched for
+        self._last_activity_by_cat: Dict[str, Optional[str]] = {}
 
     async def _async_update_data(self) -> Dict[str, Any]:
         """Fetch weight data for all cats."""
@@ -273,85 +502,239 @@ class PetivityWeightCoordinator(PetivityCoordinatorBase):
             _LOGGER.error("Error accessing status coordinator: %s", err) 
             return self._cat_weights or {}
         
-        # Calculate date range (last 7 days)
-        end_date = datetime.now().date()
+        # Calculate date range (last 7 days); the whole batch shares one timestamp
+        now_dt = datetime.now()
+        end_date = now_dt.date()
         start_date = end_date - timedelta(days=WEIGHT_TIME_WINDOW)
         
+        # Nothing to do if the same cats and window were fully refreshed recently
+        sig = (start_date, end_date, tuple(sorted(cat.id for cat in cats)))
+        now = self.hass.loop.time()
+        if sig == self._last_sig and now - self._last_refresh_ts < WEIGHT_UPDATE_INTERVAL * 60 * 0.9:
+            _LOGGER.debug("Weight data is current for all cats, skipping refresh")
+            return self._cat_weights
+        
+        now_iso = now_dt.isoformat()
+        start_iso = start_date.isoformat()
+        end_iso = end_date.isoformat()
+        
         weight_data = {}
         successful_updates = 0
         
+        # A cat with no new activity still has the same latest weight, until
+        # that activity slides out of the window
+        stale_cats = []
         for cat in cats:
-            cat_id = cat["id"]
-            cat_name = cat["name"]
-            
+            previous = self._cat_weights.get(cat.id)
+            activity_date = _activity_date(cat.last_activated)
+            if (
+                previous is not None
+                and previous.current_weight is not None
+                and activity_date is not None
+                and activity_date > start_date
+                and self._last_activity_by_cat.get(cat.id) == cat.last_activated
+            ):
+                weight_data[cat.id] = previous
+                successful_updates += 1
+            else:
+                stale_cats.append(cat)
+        
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Fetching weights for %d/%d cats with new activity", len(stale_cats), len(cats))
+        
+        results: List[Any] = []
+        if stale_cats:
+            # One batched command covers every cat; fall back to per-cat fetches
+            # so a single bad cat can't fail the whole refresh
             try:
-                # Fetch weight data for this cat
-                _LOGGER.debug("Fetching weight data for cat %s (%s)", cat_name, cat_id)
-                weight_response = await self._run_catalysis_command(
-                    "weight",
-                    cat_id,
-                    start_date.isoformat(),
-                    end_date.isoformat(),
-                    "DAY"
-                )
-                
-                # Extract current weight (most recent data point)
-                current_weight = self._extract_current_weight(weight_response, cat_name)
+                results = await self._fetch_batch(stale_cats, start_iso, end_iso, now_iso)
+            except UpdateFailed as err:
+                _LOGGER.warning("Batched weight fetch failed, fetching cats individually: %s", err)
                 
-                weight_data[cat_id] = {
-                    "cat_name": cat_name,
-                    "current_weight": current_weight,
-                    "raw_data": weight_response,
-                    "last_updated": datetime.now().isoformat(),
-                }
-                
-                successful_updates += 1
-                _LOGGER.debug("Successfully updated weight for cat %s: %s lbs", cat_name, current_weight)
+                # Every command goes through the one worker, so fetch cats in turn
+                for cat in stale_cats:
+                    try:
+                        results.append(await self._fetch_one(cat, start_iso, end_iso, now_iso))
+                    except Exception as fetch_err:
+                        results.append(fetch_err)
+        
+        for cat, result in zip(stale_cats, results):
+            if isinstance(result, Exception):
+                _LOGGER.error("Failed to fetch weight data for cat %s: %s", cat.name, result)
                 
-            except Exception as err:
-                _LOGGER.error("Failed to fetch weight data for cat %s: %s", cat_name, err)
                 # Keep previous data if available
-                if cat_id in self._cat_weights:
-                    weight_data[cat_id] = self._cat_weights[cat_id]
-                    _LOGGER.debug("Keeping previous weight data for cat %s", cat_name)
+                previous = self._cat_weights.get(cat.id)
+                if previous is not None:
+                    weight_data[cat.id] = previous
+                    _LOGGER.debug("Keeping previous weight data for cat %s", cat.name)
+                continue
+            
+            weight_data[cat.id] = result
+            
+            # A reply without a weight (e.g. a null node) is retried next time
+            if result.current_weight is not None:
+                self._last_activity_by_cat[cat.id] = cat.last_activated
+                successful_updates += 1
         
         _LOGGER.debug("Weight coordinator updated data for %d/%d cats", successful_updates, len(cats))
         self._cat_weights = weight_data
+        
+        # Only a complete refresh may be skipped next time
+        if successful_updates == len(cats):
+            self._last_sig = sig
+            self._last_refresh_ts = now
         return weight_data
     
+    async def _fetch_batch(
+        self, cats: List[Cat], start_iso: str, end_iso: str, now_iso: str
+    ) -> List[Any]:
+        """Fetch weight data for all cats with one command, returning data or an exception per cat."""
+        _LOGGER.debug("Fetching weight data for %d cats in one batch", len(cats))
+        batch_response = await self._run_catalysis_command(
+            "weight-batch",
+            ",".join(cat.id for cat in cats),
+            start_iso,
+            end_iso,
+            "DAY"
+        )
+        
+        # A failed query comes back as one GraphQL result rather than one per cat
+        if ("errors" in batch_response or "data" in batch_response) and not any(
+            cat.id in batch_response for cat in cats
+        ):
+            raise UpdateFailed(f"Batched weight query failed: {batch_response.get('errors')}")
+        
+        results = []
+        for cat in cats:
+            weight_response = batch_response.get(cat.id)
+            if weight_response is None:
+                results.append(UpdateFailed("No weight data returned"))
+            else:
+                results.append(self._build_weight_entry(cat, weight_response, now_iso))
+        
+        return results
+    
+    async def _fetch_one(
+        self, cat: Cat, start_iso: str, end_iso: str, now_iso: str
+    ) -> CatWeight:
+        """Fetch weight data for a single cat."""
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Fetching weight data for cat %s (%s)", cat.name, cat.id)
+        weight_response = await self._run_catalysis_command(
+            "weight",
+            cat.id,
+            start_iso,
+            end_iso,
+            "DAY"
+        )
+        
+        return self._build_weight_entry(cat, weight_response, now_iso)
+    
+    async def async_prime(self, status_coordinator: "PetivityStatusCoordinator") -> bool:
+        """Load status and initial weights with one combined command.
+        
+        Populates both coordinators on success. Returns False if the combined
+        command failed, in which case each coordinator should refresh itself.
+        """
+        now_dt = datetime.now()
+        end_date = now_dt.date()
+        start_date = end_date - timedelta(days=WEIGHT_TIME_WINDOW)
+        
+        try:
+            response = await self._run_catalysis_command(
+                "status-with-weight",
+                start_date.isoformat(),
+                end_date.isoformat(),
+                "DAY"
+            )
+        except UpdateFailed as err:
+            _LOGGER.warning("Combined status and weight fetch failed, loading separately: %s", err)
+            return False
+        
+        # GraphQL errors come back as a normal reply; don't let them stand in for status
+        if not _is_cacheable(response):
+            _LOGGER.warning("Combined status and weight fetch returned errors, loading separately")
+            return False
+        
+        status_coordinator.async_set_updated_data(response)
+        cats = status_coordinator.get_cats()
+        
+        # Each cat in the status response carries its own aggregatedEvents
+        cats_data = _dig(response, _CATS_PATH) or []
+        raw_cats = {cat.get("id"): cat for cat in cats_data}
+        
+        now_iso = now_dt.isoformat()
+        weight_data = {
+            cat.id: self._build_weight_entry(
+                cat, {"data": {"authenticate": {"node": raw_cats.get(cat.id)}}}, now_iso
+            )
+            for cat in cats
+        }
+        
+        self._cat_weights = weight_data
+        self._last_activity_by_cat = {
+            cat.id: cat.last_activated
+            for cat in cats
+            if weight_data[cat.id].current_weight is not None
+        }
+        # Only a complete load may be skipped next time
+        if len(self._last_activity_by_cat) == len(cats):
+            self._last_sig = (start_date, end_date, tuple(sorted(cat.id for cat in cats)))
+            self._last_refresh_ts = self.hass.loop.time()
+        self.async_set_updated_data(weight_data)
+        return True
+    
+    def _build_weight_entry(
+        self, cat: Cat, weight_response: Dict[str, Any], last_updated: str
+    ) -> CatWeight:
+        """Build the stored weight entry for a cat from its weight response."""
+        cat_name = cat.name
+        
+        # Extract current weight (most recent data point)
+        current_weight = self._extract_current_weight(weight_response, cat_name)
+        
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Successfully updated weight for cat %s: %s lbs", cat_name, current_weight)
+        return CatWeight(
+            cat_name=cat_name,
+            current_weight=current_weight,
+            last_updated=last_updated,
+        )
+    
     def _extract_current_weight(self, weight_response: Dict, cat_name: str) -> Optional[float]:
         """Extract current weight from GraphQL response."""
+        # Parse actual GraphQL response structure
+        weight_data = _dig(weight_response, _WEIGHT_PATH)
+        if weight_data is None:
+            return None
+        
         try:
-            # Parse actual GraphQL response structure
-            cat_data = weight_response.get("data", {}).get("authenticate", {}).get("node", {})
-            weight_data = cat_data.get("aggregatedEvents", {}).get("weight", [])
-            
             # Get the most recent weight measurement (last item in array)
             if weight_data:
                 latest_measurement = weight_data[-1]
                 weight_grams = latest_measurement.get("mean")
                 
                 if weight_grams is not None:
-                    # Convert grams to pounds (1 gram = 0.00220462 pounds)
-                    weight_pounds = weight_grams * 0.00220462
-                    return round(weight_pounds, 2)
+                    return _grams_to_pounds(weight_grams)
             
         except (KeyError, TypeError, IndexError) as err:
             _LOGGER.warning("Failed to extract weight for cat %s: %s", cat_name, err)
         
         return None
     
+    def get_cat_snapshot(self, cat_id: str) -> Optional[CatWeight]:
+        """Get the stored weight entry for a specific cat."""
+        return self._cat_weights.get(cat_id)
+    
     def get_cat_weight(self, cat_id: str) -> Optional[float]:
         """Get current weight for a specific cat."""
-        if cat_id in self._cat_weights:
-            return self._cat_weights[cat_id].get("current_weight")
-        return None
+        snapshot = self._cat_weights.get(cat_id)
+        return snapshot.current_weight if snapshot is not None else None
     
     def get_cat_name(self, cat_id: str) -> Optional[str]:
         """Get cat name for a specific cat ID."""
-        if cat_id in self._cat_weights:
-            return self._cat_weights[cat_id].get("cat_name")
-        return None
+        snapshot = self._cat_weights.get(cat_id)
+        return snapshot.cat_name if snapshot is not None else None
 
     async def async_get_historical_weight(self, cat_id: str, days: int = 30) -> List[Dict[str, Any]]:
         """Fetch historical weight data for a specific cat over a given number of days."""
@@ -361,12 +744,14 @@ class PetivityWeightCoordinator(PetivityCoordinatorBase):
         
         try:
             # Fetch weight data using existing command
+            # The service keeps its own short-lived cache of results
             weight_response = await self._run_catalysis_command(
                 "weight",
                 cat_id,
                 start_date.isoformat(),
                 end_date.isoformat(),
-                "DAY"
+                "DAY",
+                cache=False,
             )
             
             # Extract all historical weight measurements
@@ -389,25 +774,23 @@ class PetivityWeightCoordinator(PetivityCoordinatorBase):
         """Extract all weight measurements from GraphQL response."""
         measurements = []
         
+        # Parse actual GraphQL response structure
+        weight_data = _dig(weight_response, _WEIGHT_PATH)
+        if weight_data is None:
+            return measurements
+        
         try:
-            # Parse actual GraphQL response structure
-            cat_data = weight_response.get("data", {}).get("authenticate", {}).get("node", {})
-            weight_data = cat_data.get("aggregatedEvents", {}).get("weight", [])
-            
             for measurement in weight_data:
                 weight_grams = measurement.get("mean")
                 date_str = measurement.get("date")
                 
                 if weight_grams is not None and date_str is not None:
-                    # Convert grams to pounds
-                    weight_pounds = weight_grams * 0.00220462
-                    
                     measurements.append({
                         "date": date_str,
-                        "weight": round(weight_pounds, 2),
+                        "weight": _grams_to_pounds(weight_grams),
                         "weight_grams": weight_grams,
-                        "min_weight": measurement.get("min", 0) * 0.00220462 if measurement.get("min") else None,
-                        "max_weight": measurement.get("max", 0) * 0.00220462 if measurement.get("max") else None,
+                        "min_weight": measurement.get("min", 0) * GRAMS_TO_POUNDS if measurement.get("min") else None,
+                        "max_weight": measurement.get("max", 0) * GRAMS_TO_POUNDS if measurement.get("max") else None,
                         "num_days": measurement.get("numDays", 1),
                     })
             
@@ -0,0 +1,54 @@
+"""Data models for Petivity integration."""
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+
+@dataclass(slots=True, frozen=True)
+class Cat:
+    """A cat parsed from the status response."""
+    
+    id: str
+    name: Optional[str]
+    most_recent_event: Optional[str]
+    last_activated: Optional[str]
+    cat_not_seen_warning: bool
+
+
+@dataclass(slots=True, frozen=True)
+class Machine:
+    """A litter box parsed from the status response."""
+    
+    id: str
+    slug: str
+    name: Optional[str]
+    battery_percentage: Optional[int]
+    show_battery_warning: bool
+    wifi_rssi: Optional[int]
+    power_mode: Optional[str]
+    is_frozen: bool
+    most_recent_upload: Optional[str]
+    upload_warning: bool
+    is_dirty: bool
+    balanced_status: Optional[str]
+    primary_state: str
+    status_string: str
+    
+    # Enhanced event tracking
+    recent_events: List[Dict[str, Any]]
+    recent_event_count: int
+    event_counts: Dict[str, int]
+    most_recent_event: Optional[Dict[str, Any]]
+    last_event_time: Optional[str]
+    last_event_type: Optional[str]
+    last_event_title: str
+    last_event_cat_id: Optional[str]
+    last_event_cat_name: str
+
+
+@dataclass(slots=True, frozen=True)
+class CatWeight:
+    """The latest weight fetched for a cat."""
+    
+    cat_name: Optional[str]
+    current_weight: Optional[float]
+    last_updated: str
@@ -1,19 +1,43 @@
 """Sensor platform for Petivity integration."""
 from datetime import datetime
-from typing import Any, Dict, Optional
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
 import logging
 
 from homeassistant.components.sensor import SensorEntity, SensorDeviceClass, SensorStateClass
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.const import UnitOfMass
 
 from .const import DOMAIN
+from .models import Cat, CatWeight, Machine
 
 _LOGGER = logging.getLogger(__name__)
 
+# Entities only read coordinator data, so state updates need no serializing
+PARALLEL_UPDATES = 0
+
+# Icons
+_ICON_CAT = "mdi:cat"
+_ICON_DEVICES = "mdi:devices"
+_ICON_LITTER_BOX = "mdi:litter-box"
+_ICON_SCALE = "mdi:scale"
+_ICON_BATTERY = "mdi:battery"
+_ICON_COUNTER = "mdi:counter"
+_ICON_INFO = "mdi:information"
+
+# Weight attribute values
+_SOURCE_PETIVITY = "petivity_api"
+_ATTR_UNIT_POUNDS = "pounds"
+_ATTR_UNIT_GRAMS = "grams"
+
+@lru_cache(maxsize=256)
+def _format_machine_name(machine_name: Optional[str], suffix: str) -> str:
+    """Format a machine sensor name; repeated pairs share one string."""
+    return f"Petivity {machine_name or 'Machine'} {suffix}"
+
 async def async_setup_entry(
     hass: HomeAssistant,
     config_entry: ConfigEntry,
@@ -25,60 +49,45 @@ async def async_setup_entry(
         status_coordinator = coordinators["status_coordinator"]
         weight_coordinator = coordinators["weight_coordinator"]
         
-        entities = []
-        
         # Verify coordinators have data
         if not status_coordinator.data:
             _LOGGER.error("Status coordinator has no data available")
             return
         
-        # Dynamically create cat sensors based on discovered cats
+        # Dynamically create sensors from one snapshot of discovered cats and machines
         cats = status_coordinator.get_cats()
-        _LOGGER.debug("Setting up sensors for %d cats", len(cats))
-        
-        for cat in cats:
-            cat_id = cat["id"]
-            cat_name = cat.get("name", "Unknown")
-            _LOGGER.debug("Creating sensors for cat: %s (ID: %s)", cat_name, cat_id)
-            
-            try:
-                entities.extend([
-                    PetivityCatActivitySensor(status_coordinator, config_entry, cat_id),
-                    PetivityCatWeightSensor(weight_coordinator, config_entry, cat_id),
-                ])
-            except Exception as err:
-                _LOGGER.error("Failed to create sensors for cat %s: %s", cat_name, err)
-        
-        # Dynamically create machine sensors based on discovered machines  
         machines = status_coordinator.get_machines()
-        _LOGGER.debug("Setting up sensors for %d machines", len(machines))
+        _LOGGER.debug("Setting up sensors for %d cats and %d machines", len(cats), len(machines))
+        
+        entities: List[SensorEntity] = [
+            sensor
+            for cat in cats
+            for sensor in (
+                PetivityCatActivitySensor(status_coordinator, config_entry, cat.id),
+                PetivityCatWeightSensor(weight_coordinator, config_entry, cat),
+            )
+        ]
         
         for machine in machines:
-            machine_id = machine["id"]
-            machine_name = machine.get("name", "Unknown")
-            _LOGGER.debug("Creating sensors for machine: %s (ID: %s)", machine_name, machine_id)
+            entities.extend((
+                PetivityMachineStatusSensor(status_coordinator, config_entry, machine),
+                PetivityMachineEventCountSensor(status_coordinator, config_entry, machine),
+                PetivityMachineLastEventSensor(status_coordinator, config_entry, machine),
+            ))
             
-            try:
-                entities.extend([
-                    PetivityMachineStatusSensor(status_coordinator, config_entry, machine_id),
-                    PetivityMachineEventCountSensor(status_coordinator, config_entry, machine_id),
-                    PetivityMachineLastEventSensor(status_coordinator, config_entry, machine_id),
-                ])
-                
-                # Only add battery sensor if machine has battery (not AC powered)
-                if machine.get("battery_percentage") is not None:
-                    entities.append(
-                        PetivityMachineBatterySensor(status_coordinator, config_entry, machine_id)
-                    )
-            except Exception as err:
-                _LOGGER.error("Failed to create sensors for machine %s: %s", machine_name, err)
+            # Only add battery sensor if machine has battery (not AC powered)
+            if machine.battery_percentage is not None:
+                entities.append(
+                    PetivityMachineBatterySensor(status_coordinator, config_entry, machine)
+                )
         
         if not entities:
             _LOGGER.warning("No sensors were created - no cats or machines found")
             return
         
         _LOGGER.info("Adding %d Petivity sensors", len(entities))
-        async_add_entities(entities, update_before_add=True)
+        # Coordinators were refreshed during setup; entities start from that data
+        async_add_entities(entities)
     
     except Exception as err:
         _LOGGER.error("Critical error during sensor setup: %s", err)
@@ -98,368 +107,295 @@ async def async_setup_entry(
 class PetivitySensorBase(CoordinatorEntity, SensorEntity):
     """Base class for Petivity sensors."""
     
+    # Per-sensor availability rule, set alongside the other values
+    _is_available = True
+    
     def __init__(self, coordinator, config_entry: ConfigEntry, sensor_type: str) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator)
         self.config_entry = config_entry
         self._sensor_type = sensor_type
         self._attr_unique_id = f"{config_entry.entry_id}_{sensor_type}"
-        
-    @property
-    def device_info(self) -> Dict[str, Any]:
-        """Return device information."""
-        return {
-            "identifiers": {(DOMAIN, self.config_entry.entry_id)},
+        self._attr_device_info = {
+            "identifiers": {(DOMAIN, config_entry.entry_id)},
             "name": "Petivity System",
             "manufacturer": "Petivity",
             "sw_version": "1.0.0",
         }
+        self._update_from_coordinator()
+    
+    @property
+    def available(self) -> bool:
+        """Return if the last update succeeded and this sensor has a value to show."""
+        return super().available and self._is_available
+    
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Update the entity from fresh coordinator data, then write state."""
+        self._update_from_coordinator()
+        super()._handle_coordinator_update()
+    
+    def _update_from_coordinator(self) -> None:
+        """Set the _attr_* values from the current coordinator data."""
 
 class PetivityCatCountSensor(PetivitySensorBase):
     """Sensor for number of cats."""
     
+    _attr_name = "Petivity Cat Count"
+    _attr_icon = _ICON_CAT
+    
     def __init__(self, coordinator, config_entry: ConfigEntry) -> None:
         """Initialize cat count sensor."""
         super().__init__(coordinator, config_entry, "cat_count")
-        self._attr_name = "Petivity Cat Count"
-        self._attr_icon = "mdi:cat"
     
-    @property
-    def native_value(self) -> Optional[int]:
-        """Return the number of cats."""
-        cats = self.coordinator.get_cats()
-        return len(cats) if cats else None
+    def _update_from_coordinator(self) -> None:
+        """Update the number of cats."""
+        self._attr_native_value = self.coordinator.get_cat_count() or None
 
 class PetivityMachineCountSensor(PetivitySensorBase):
     """Sensor for number of machines."""
     
+    _attr_name = "Petivity Machine Count"
+    _attr_icon = _ICON_DEVICES
+    
     def __init__(self, coordinator, config_entry: ConfigEntry) -> None:
         """Initialize machine count sensor."""
         super().__init__(coordinator, config_entry, "machine_count")
-        self._attr_name = "Petivity Machine Count"
-        self._attr_icon = "mdi:devices"
     
-    @property
-    def native_value(self) -> Optional[int]:
-        """Return the number of machines."""
-        machines = self.coordinator.get_machines()
-        return len(machines) if machines else None
+    def _update_from_coordinator(self) -> None:
+        """Update the number of machines."""
+        self._attr_native_value = self.coordinator.get_machine_count() or None
 
 class PetivityMachineStatusSensor(PetivitySensorBase):
     """Sensor for individual machine status."""
     
-    def __init__(self, coordinator, config_entry: ConfigEntry, machine_id: str) -> None:
-        """Initialize machine status sensor."""
-        self._machine_id = machine_id
-        super().__init__(coordinator, config_entry, f"machine_{machine_id.lower().replace(' ', '_')}_status")
-        self._attr_icon = "mdi:litter-box"
+    _attr_icon = _ICON_LITTER_BOX
     
-    @property
-    def name(self) -> Optional[str]:
-        """Return sensor name."""
-        machines = self.coordinator.get_machines()
-        for machine in machines:
-            if machine["id"] == self._machine_id:
-                return f"Petivity {machine.get('name', 'Machine')} Status"
-        return f"Petivity Machine {self._machine_id} Status"
-    
-    @property
-    def native_value(self) -> Optional[str]:
-        """Return machine status."""
-        machines = self.coordinator.get_machines()
-        for machine in machines:
-            if machine["id"] == self._machine_id:
-                # Create a status based on multiple factors
-                status_parts = []
-                
-                if machine.get("is_frozen"):
-                    status_parts.append("FROZEN")
-                elif machine.get("upload_warning"):
-                    status_parts.append("UPLOAD_WARNING")
-                elif machine.get("show_battery_warning"):
-                    status_parts.append("LOW_BATTERY")
-                elif machine.get("is_dirty"):
-                    status_parts.append("NEEDS_CLEANING")
-                else:
-                    status_parts.append("NORMAL")
-                
-                # Add power mode
-                power_mode = machine.get("power_mode", "UNKNOWN")
-                status_parts.append(power_mode)
-                
-                return " | ".join(status_parts)
-        return None
-    
-    @property
-    def extra_state_attributes(self) -> Optional[Dict[str, Any]]:
-        """Return additional attributes."""
-        machines = self.coordinator.get_machines()
-        for machine in machines:
-            if machine["id"] == self._machine_id:
-                attrs = {
-                    "machine_id": machine["id"],
-                    "name": machine.get("name"),
-                    "battery_percentage": machine.get("battery_percentage"),
-                    "power_mode": machine.get("power_mode"),
-                    "wifi_rssi": machine.get("wifi_rssi"),
-                    "is_dirty": machine.get("is_dirty"),
-                    "is_frozen": machine.get("is_frozen"),
-                    "balanced_status": machine.get("balanced_status"),
-                    "most_recent_upload": machine.get("most_recent_upload"),
-                    "recent_events_today": machine.get("recent_event_count", 0),
-                    "last_event_time": machine.get("last_event_time"),
-                }
-                
-                # Only include battery percentage if it exists (some machines are AC powered)
-                if machine.get("battery_percentage") is not None:
-                    attrs["battery_level"] = machine["battery_percentage"]
-                
-                return attrs
-        return None
+    def __init__(self, coordinator, config_entry: ConfigEntry, machine: Machine) -> None:
+        """Initialize machine status sensor."""
+        self._machine_id = machine.id
+        super().__init__(coordinator, config_entry, f"machine_{machine.slug}_status")
+    
+    def _update_from_coordinator(self) -> None:
+        """Update name, status and attributes from this machine."""
+        machine = self.coordinator.get_machine_by_id(self._machine_id)
+        if machine is None:
+            self._attr_name = _format_machine_name(f"Machine {self._machine_id}", "Status")
+            self._attr_native_value = None
+            self._attr_extra_state_attributes = None
+            return
+        
+        self._attr_name = _format_machine_name(machine.name, "Status")
+        self._attr_native_value = machine.status_string
+        self._attr_extra_state_attributes = self._build_attributes(machine)
+    
+    def _build_attributes(self, machine: Machine) -> Dict[str, Any]:
+        """Build the attributes for a machine snapshot."""
+        attrs = {
+            "machine_id": machine.id,
+            "name": machine.name,
+            "battery_percentage": machine.battery_percentage,
+            "power_mode": machine.power_mode,
+            "wifi_rssi": machine.wifi_rssi,
+            "is_dirty": machine.is_dirty,
+            "is_frozen": machine.is_frozen,
+            "balanced_status": machine.balanced_status,
+            "most_recent_upload": machine.most_recent_upload,
+            "recent_events_today": machine.recent_event_count,
+            "last_event_time": machine.last_event_time,
+        }
+        
+        # Only include battery percentage if it exists (some machines are AC powered)
+        if machine.battery_percentage is not None:
+            attrs["battery_level"] = machine.battery_percentage
+        
+        return attrs
 
 class PetivityCatWeightSensor(PetivitySensorBase):
     """Sensor for cat weight."""
     
-    def __init__(self, coordinator, config_entry: ConfigEntry, cat_id: str) -> None:
-        """Initialize cat weight sensor."""
-        self._cat_id = cat_id
-        super().__init__(coordinator, config_entry, f"cat_{cat_id}_weight")
-        self._attr_device_class = SensorDeviceClass.WEIGHT
-        self._attr_native_unit_of_measurement = UnitOfMass.POUNDS
-        self._attr_state_class = SensorStateClass.MEASUREMENT
-        self._attr_icon = "mdi:scale"
-    
-    @property
-    def name(self) -> Optional[str]:
-        """Return sensor name."""
-        cat_name = self.coordinator.get_cat_name(self._cat_id)
-        if cat_name:
-            return f"{cat_name} Weight"
-        return f"Cat {self._cat_id} Weight"
+    _attr_device_class = SensorDeviceClass.WEIGHT
+    _attr_native_unit_of_measurement = UnitOfMass.POUNDS
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_icon = _ICON_SCALE
     
-    @property
-    def native_value(self) -> Optional[float]:
-        """Return cat weight."""
-        return self.coordinator.get_cat_weight(self._cat_id)
-    
-    @property
-    def extra_state_attributes(self) -> Optional[Dict[str, Any]]:
-        """Return additional attributes."""
-        if hasattr(self.coordinator, '_cat_weights') and self._cat_id in self.coordinator._cat_weights:
-            weight_data = self.coordinator._cat_weights[self._cat_id]
-            return {
-                "cat_id": self._cat_id,
-                "cat_name": weight_data.get("cat_name"),
-                "last_updated": weight_data.get("last_updated"),
-                "data_source": "petivity_api",
-                "unit": "pounds",
-                "original_unit": "grams",
-            }
-        return None
-    
-    @property
-    def available(self) -> bool:
-        """Return if sensor is available."""
-        return self.coordinator.get_cat_weight(self._cat_id) is not None
+    def __init__(self, coordinator, config_entry: ConfigEntry, cat: Cat) -> None:
+        """Initialize cat weight sensor."""
+        self._cat_id = cat.id
+        # Name from the status data until this cat has a weight entry
+        self._cat_name = cat.name
+        super().__init__(coordinator, config_entry, f"cat_{cat.id}_weight")
+    
+    def _update_from_coordinator(self) -> None:
+        """Update name, weight and attributes from this cat's weight entry."""
+        snapshot = self.coordinator.get_cat_snapshot(self._cat_id)
+        if snapshot is None:
+            self._attr_name = f"{self._cat_name} Weight" if self._cat_name else f"Cat {self._cat_id} Weight"
+            self._attr_native_value = None
+            self._attr_extra_state_attributes = None
+            self._is_available = False
+            return
+        
+        cat_name = snapshot.cat_name or self._cat_name
+        self._attr_name = f"{cat_name} Weight" if cat_name else f"Cat {self._cat_id} Weight"
+        self._attr_native_value = snapshot.current_weight
+        self._attr_extra_state_attributes = self._build_attributes(snapshot)
+        self._is_available = snapshot.current_weight is not None
+    
+    def _build_attributes(self, snapshot: CatWeight) -> Dict[str, Any]:
+        """Build the attributes for a weight snapshot."""
+        return {
+            "cat_id": self._cat_id,
+            "cat_name": snapshot.cat_name,
+            "last_updated": snapshot.last_updated,
+            "data_source": _SOURCE_PETIVITY,
+            "unit": _ATTR_UNIT_POUNDS,
+            "original_unit": _ATTR_UNIT_GRAMS,
+        }
 
 class PetivityCatActivitySensor(PetivitySensorBase):
     """Sensor for cat activity status."""
     
+    _attr_icon = _ICON_CAT
+    
     def __init__(self, coordinator, config_entry: ConfigEntry, cat_id: str) -> None:
         """Initialize cat activity sensor."""
         self._cat_id = cat_id
         super().__init__(coordinator, config_entry, f"cat_{cat_id}_activity")
-        self._attr_icon = "mdi:cat"
-    
-    @property
-    def name(self) -> Optional[str]:
-        """Return sensor name."""
-        cats = self.coordinator.get_cats()
-        for cat in cats:
-            if cat["id"] == self._cat_id:
-                return f"{cat['name']} Activity"
-        return f"Cat {self._cat_id} Activity"
-    
-    @property
-    def native_value(self) -> Optional[str]:
-        """Return cat activity status."""
-        cats = self.coordinator.get_cats()
-        for cat in cats:
-            if cat["id"] == self._cat_id:
-                if cat.get("cat_not_seen_warning"):
-                    return "Not Seen"
-                elif cat.get("most_recent_event"):
-                    return "Active"
-                else:
-                    return "Unknown"
-        return None
     
-    @property
-    def extra_state_attributes(self) -> Optional[Dict[str, Any]]:
-        """Return additional attributes."""
-        cats = self.coordinator.get_cats()
-        for cat in cats:
-            if cat["id"] == self._cat_id:
-                return {
-                    "cat_id": self._cat_id,
-                    "cat_name": cat.get("name"),
-                    "most_recent_event": cat.get("most_recent_event"),
-                    "last_activated": cat.get("last_activated"),
-                    "not_seen_warning": cat.get("cat_not_seen_warning", False),
-                }
-        return None
+    def _update_from_coordinator(self) -> None:
+        """Update name, activity and attributes from this cat."""
+        cat = self.coordinator.get_cat_by_id(self._cat_id)
+        if cat is None:
+            self._attr_name = f"Cat {self._cat_id} Activity"
+            self._attr_native_value = None
+            self._attr_extra_state_attributes = None
+            return
+        
+        self._attr_name = f"{cat.name} Activity"
+        if cat.cat_not_seen_warning:
+            self._attr_native_value = "Not Seen"
+        elif cat.most_recent_event:
+            self._attr_native_value = "Active"
+        else:
+            self._attr_native_value = "Unknown"
+        self._attr_extra_state_attributes = self._build_attributes(cat)
+    
+    def _build_attributes(self, cat: Cat) -> Dict[str, Any]:
+        """Build the attributes for a cat snapshot."""
+        return {
+            "cat_id": self._cat_id,
+            "cat_name": cat.name,
+            "most_recent_event": cat.most_recent_event,
+            "last_activated": cat.last_activated,
+            "not_seen_warning": cat.cat_not_seen_warning,
+        }
 
 class PetivityMachineBatterySensor(PetivitySensorBase):
     """Sensor for machine battery level."""
     
-    def __init__(self, coordinator, config_entry: ConfigEntry, machine_id: str) -> None:
-        """Initialize machine battery sensor."""
-        self._machine_id = machine_id
-        super().__init__(coordinator, config_entry, f"machine_{machine_id.lower().replace(' ', '_')}_battery")
-        self._attr_device_class = SensorDeviceClass.BATTERY
-        self._attr_native_unit_of_measurement = "%"
-        self._attr_state_class = SensorStateClass.MEASUREMENT
-        self._attr_icon = "mdi:battery"
-    
-    @property
-    def name(self) -> Optional[str]:
-        """Return sensor name."""
-        machines = self.coordinator.get_machines()
-        for machine in machines:
-            if machine["id"] == self._machine_id:
-                return f"Petivity {machine.get('name', 'Machine')} Battery"
-        return f"Petivity Machine {self._machine_id} Battery"
-    
-    @property
-    def native_value(self) -> Optional[int]:
-        """Return battery percentage."""
-        machines = self.coordinator.get_machines()
-        for machine in machines:
-            if machine["id"] == self._machine_id:
-                return machine.get("battery_percentage")
-        return None
+    _attr_device_class = SensorDeviceClass.BATTERY
+    _attr_native_unit_of_measurement = "%"
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_icon = _ICON_BATTERY
     
-    @property
-    def available(self) -> bool:
-        """Return if sensor is available (only for battery-powered machines)."""
-        machines = self.coordinator.get_machines()
-        for machine in machines:
-            if machine["id"] == self._machine_id:
-                return machine.get("battery_percentage") is not None
-        return False
+    def __init__(self, coordinator, config_entry: ConfigEntry, machine: Machine) -> None:
+        """Initialize machine battery sensor."""
+        self._machine_id = machine.id
+        super().__init__(coordinator, config_entry, f"machine_{machine.slug}_battery")
+    
+    def _update_from_coordinator(self) -> None:
+        """Update name and battery level from this machine."""
+        machine = self.coordinator.get_machine_by_id(self._machine_id)
+        if machine is None:
+            self._attr_name = _format_machine_name(f"Machine {self._machine_id}", "Battery")
+            self._attr_native_value = None
+            self._is_available = False
+            return
+        
+        self._attr_name = _format_machine_name(machine.name, "Battery")
+        self._attr_native_value = machine.battery_percentage
+        # Only available for battery-powered machines
+        self._is_available = machine.battery_percentage is not None
 
 class PetivityMachineEventCountSensor(PetivitySensorBase):
     """Sensor for machine recent event count."""
     
-    def __init__(self, coordinator, config_entry: ConfigEntry, machine_id: str) -> None:
-        """Initialize machine event count sensor."""
-        self._machine_id = machine_id
-        super().__init__(coordinator, config_entry, f"machine_{machine_id.lower().replace(' ', '_')}_events")
-        self._attr_state_class = SensorStateClass.MEASUREMENT
-        self._attr_icon = "mdi:counter"
-    
-    @property
-    def name(self) -> Optional[str]:
-        """Return sensor name."""
-        machines = self.coordinator.get_machines()
-        for machine in machines:
-            if machine["id"] == self._machine_id:
-                return f"Petivity {machine.get('name', 'Machine')} Recent Events"
-        return f"Petivity Machine {self._machine_id} Recent Events"
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_icon = _ICON_COUNTER
     
-    @property
-    def native_value(self) -> Optional[int]:
-        """Return recent event count."""
-        machines = self.coordinator.get_machines()
-        for machine in machines:
-            if machine["id"] == self._machine_id:
-                return machine.get("recent_event_count", 0)
-        return None
+    def __init__(self, coordinator, config_entry: ConfigEntry, machine: Machine) -> None:
+        """Initialize machine event count sensor."""
+        self._machine_id = machine.id
+        super().__init__(coordinator, config_entry, f"machine_{machine.slug}_events")
+    
+    def _update_from_coordinator(self) -> None:
+        """Update name, event count and attributes from this machine."""
+        machine = self.coordinator.get_machine_by_id(self._machine_id)
+        if machine is None:
+            self._attr_name = _format_machine_name(f"Machine {self._machine_id}", "Recent Events")
+            self._attr_native_value = None
+            self._attr_extra_state_attributes = None
+            return
+        
+        self._attr_name = _format_machine_name(machine.name, "Recent Events")
+        self._attr_native_value = machine.recent_event_count
+        self._attr_extra_state_attributes = self._build_attributes(machine)
     
-    @property
-    def extra_state_attributes(self) -> Optional[Dict[str, Any]]:
-        """Return additional attributes."""
-        machines = self.coordinator.get_machines()
-        for machine in machines:
-            if machine["id"] == self._machine_id:
-                return {
-                    "machine_id": machine["id"],
-                    "machine_name": machine.get("name"),
-                    "last_event_time": machine.get("last_event_time"),
-                    "time_period": "recent_eliminations",
-                }
-        return None
+    def _build_attributes(self, machine: Machine) -> Dict[str, Any]:
+        """Build the attributes for a machine snapshot."""
+        return {
+            "machine_id": machine.id,
+            "machine_name": machine.name,
+            "last_event_time": machine.last_event_time,
+            "time_period": "recent_eliminations",
+        }
 
 class PetivityMachineLastEventSensor(PetivitySensorBase):
     """Sensor for machine's last elimination event details."""
     
-    def __init__(self, coordinator, config_entry: ConfigEntry, machine_id: str) -> None:
-        """Initialize machine last event sensor."""
-        self._machine_id = machine_id
-        super().__init__(coordinator, config_entry, f"machine_{machine_id.lower().replace(' ', '_')}_last_event")
-        self._attr_icon = "mdi:information"
-    
-    @property
-    def name(self) -> Optional[str]:
-        """Return sensor name."""
-        machines = self.coordinator.get_machines()
-        for machine in machines:
-            if machine["id"] == self._machine_id:
-                return f"Petivity {machine.get('name', 'Machine')} Last Event"
-        return f"Petivity Machine {self._machine_id} Last Event"
+    _attr_icon = _ICON_INFO
     
-    @property
-    def native_value(self) -> Optional[str]:
-        """Return last event type."""
-        machines = self.coordinator.get_machines()
-        for machine in machines:
-            if machine["id"] == self._machine_id:
-                event_type = machine.get("last_event_type")
-                if event_type:
-                    return event_type.title()  # Capitalize first letter
-                return "None"
-        return None
-    
-    @property
-    def extra_state_attributes(self) -> Optional[Dict[str, Any]]:
-        """Return detailed event information."""
-        machines = self.coordinator.get_machines()
-        for machine in machines:
-            if machine["id"] == self._machine_id:
-                # Get cat name for the last event
-                cat_name = "Unknown"
-                if machine.get("last_event_cat_id"):
-                    cats = self.coordinator.get_cats()
-                    for cat in cats:
-                        if cat["id"] == machine["last_event_cat_id"]:
-                            cat_name = cat["name"]
-                            break
-                
-                return {
-                    "machine_id": machine["id"],
-                    "machine_name": machine.get("name"),
-                    "last_event_time": machine.get("last_event_time"),
-                    "last_event_type": machine.get("last_event_type"),
-                    "last_event_cat": cat_name,
-                    "last_event_cat_id": machine.get("last_event_cat_id"),
-                    
-                    # Event counts by type
-                    "urination_count": machine.get("event_counts", {}).get("urination", 0),
-                    "defecation_count": machine.get("event_counts", {}).get("defecation", 0),
-                    "combo_count": machine.get("event_counts", {}).get("combo", 0),
-                    "unknown_count": machine.get("event_counts", {}).get("unknown", 0),
-                    "total_events": machine.get("recent_event_count", 0),
-                    
-                    # All recent events (limited to last 10 for performance)
-                    "recent_events": machine.get("recent_events", [])[:10],
-                }
-        return None
-    
-    @property
-    def available(self) -> bool:
-        """Return if sensor is available."""
-        machines = self.coordinator.get_machines()
-        for machine in machines:
-            if machine["id"] == self._machine_id:
-                return machine.get("recent_event_count", 0) > 0
-        return False
\ No newline at end of file
+    def __init__(self, coordinator, config_entry: ConfigEntry, machine: Machine) -> None:
+        """Initialize machine last event sensor."""
+        self._machine_id = machine.id
+        super().__init__(coordinator, config_entry, f"machine_{machine.slug}_last_event")
+    
+    def _update_from_coordinator(self) -> None:
+        """Update name, last event and attributes from this machine."""
+        machine = self.coordinator.get_machine_by_id(self._machine_id)
+        if machine is None:
+            self._attr_name = _format_machine_name(f"Machine {self._machine_id}", "Last Event")
+            self._attr_native_value = None
+            self._attr_extra_state_attributes = None
+            self._is_available = False
+            return
+        
+        self._attr_name = _format_machine_name(machine.name, "Last Event")
+        self._attr_native_value = machine.last_event_title
+        self._attr_extra_state_attributes = self._build_attributes(machine)
+        self._is_available = machine.recent_event_count > 0
+    
+    def _build_attributes(self, machine: Machine) -> Dict[str, Any]:
+        """Build the event attributes for a machine snapshot."""
+        # Always has all four keys; the parser starts every count at zero
+        event_counts = machine.event_counts
+        
+        return {
+            "machine_id": machine.id,
+            "machine_name": machine.name,
+            "last_event_time": machine.last_event_time,
+            "last_event_type": machine.last_event_type,
+            "last_event_cat": machine.last_event_cat_name,
+            "last_event_cat_id": machine.last_event_cat_id,
+            
+            # Event counts by type
+            "urination_count": event_counts["urination"],
+            "defecation_count": event_counts["defecation"],
+            "combo_count": event_counts["combo"],
+            "unknown_count": event_counts["unknown"],
+            "total_events": machine.recent_event_count,
+            
+            # All recent events (limited to last 10 for performance)
+            "recent_events": machine.recent_events[:10],
+        }